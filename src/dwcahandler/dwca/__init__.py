@@ -28,8 +28,11 @@ CoreOrExtType = namedtuple("CoreOrExtType", ["CORE", "EXTENSION"])(
     EXTENSION="extension"
 )
 
+# Escaped csv encoding values found in meta.xml and their actual characters
+CSV_ENCODING_TRANSLATE_TABLE = {'LF': '\r\n', '\\t': '\t', '\\n': '\n', '&quot;': '"'}
 
-@dataclass
+
+@dataclass(frozen=True)
 class CSVEncoding:
     """The encoding used in a CSV file.
 
@@ -46,8 +49,9 @@ class CSVEncoding:
     csv_escape_char: str = field(default='"')
 
     def __post_init__(self):
-        self.csv_delimiter = self.__convert_values(self.csv_delimiter)
-        self.csv_eol = self.__convert_values(self.csv_eol) if self.csv_eol != '' else '\n'
+        # Frozen, so the converted values are set through object.__setattr__
+        object.__setattr__(self, 'csv_delimiter', self.__convert_values(self.csv_delimiter))
+        object.__setattr__(self, 'csv_eol', self.__convert_values(self.csv_eol) if self.csv_eol != '' else '\n')
 
     def __convert_values(self, v):
         """Convert escaped character specifications into their actual counterparts.
@@ -56,8 +60,11 @@ class CSVEncoding:
 
         :param v: The character string to convert
         :return: The actual character to use."""
-        translate_table: dict = {'LF': '\r\n', '\\t': '\t', '\\n': '\n', '&quot;': '"'}
-        return translate_table[v] if v in translate_table.keys() else v
+        return CSV_ENCODING_TRANSLATE_TABLE.get(v, v)
+
+
+# CSVEncoding is immutable, so a single default instance is shared
+DEFAULT_CSV_ENCODING = CSVEncoding()
 
 
 @dataclass
@@ -70,18 +77,14 @@ class CsvFileType:
     # when creating dwca. for core other than occurrence, this neeeds to be supplied as key.
     # column keys lookup in core or extension for delete records
     associated_files_loc: Optional[str] = None  # in case there are associated media that need to be packaged in dwca
-    csv_encoding: CSVEncoding = field(
-        default_factory=lambda: CSVEncoding(csv_delimiter=",", csv_eol="\n", csv_text_enclosure='"',
-                                            csv_escape_char='"'))
+    csv_encoding: CSVEncoding = DEFAULT_CSV_ENCODING
     # delimiter: Optional[str] = None
     # file delimiter type when reading the csv. if not supplied, the collectory setting delimiter is read in for the dr
 
 
 class Stat:
     """Record statistics for a DwCA"""
-    start_record_count: int = 0
-    current_record_count: int = 0
-    updated_record_count: int = 0
+    __slots__ = ('start_record_count', 'current_record_count', 'updated_record_count')
 
     def __init__(self, records: int = 0):
         """
@@ -89,8 +92,9 @@ class Stat:
 
         :param records: The intial number of records (0 by default)
         """
-        self.start_record_count = records
-        self.current_record_count = records
+        self.start_record_count: int = records
+        self.current_record_count: int = records
+        self.updated_record_count: int = 0
 
     def set_stat(self, new_count):
         """Set the current record count.
@@ -120,9 +124,7 @@ class Stat:
         """Get the different between the start record count and the current record count.
 
         :return: The count difference"""
-        return (self.current_record_count - self.start_record_count) \
-            if self.current_record_count > self.start_record_count \
-            else (self.start_record_count - self.current_record_count)
+        return abs(self.current_record_count - self.start_record_count)
 
     def get_stat(self) -> str:
         """Get the statistics as a formatted string.
@@ -144,14 +146,15 @@ def record_diff_stat(func):
     """Record stats for dataframe content"""
     @wraps(func)
     def wrapper_function(self, *args, **kwargs):
-        params = list(kwargs.keys())
-        if len(params) >= 1:
-            record_content = kwargs[params[0]]
+        if kwargs:
+            # The content to record stats for is the first keyword argument
+            record_content = next(iter(kwargs.values()))
             ret_value = func(self, *args, **kwargs)
             record_content.stat.set_stat(self.count_stat(ret_value))
-            logging.debug("%s %s %s stats shows %s",
-                          func.__name__, record_content.meta_info.core_or_ext_type,
-                          record_content.meta_info.type.name, str(record_content.stat))
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                logging.debug("%s %s %s stats shows %s",
+                              func.__name__, record_content.meta_info.core_or_ext_type,
+                              record_content.meta_info.type.name, record_content.stat)
             return ret_value
 
         ret_value = func(self, *args, **kwargs)
@@ -165,11 +168,11 @@ class Defaults:
     """
     A class to hold default properties for Dwca
     """
-    csv_encoding: CSVEncoding = field(
-        default_factory=lambda: CSVEncoding(csv_delimiter=",", csv_eol="\n", csv_text_enclosure='"',
-                                            csv_escape_char='"'))
+    csv_encoding: CSVEncoding = DEFAULT_CSV_ENCODING
     eml_xml_filename: str = 'eml.xml'
     meta_xml_filename: str = 'meta.xml'
+    # Deflate level for the archive, 1 is several times faster than the zlib default for slightly larger files
+    zip_compresslevel: int = 1
     # Translation csv encoding values
     translate_table: dict = field(init=False,
                                   default_factory=lambda: {'LF': '\r\n', '\\t': '\t', '\\n': '\n'})
@@ -138,7 +138,7 @@ class BaseDwca(metaclass=ABCMeta):
             raise SystemExit(Exception("Some validations error found. Dwca is not created."))
 
         # if multimedia files is supplied, do not attempt to convert associated media to multimedia
-        if not any(ext.type == 'multimedia' for ext in ext_csv_list):
+        if not any(MetaElementTypes.get_element(ext.type) is MetaElementTypes.multimedia for ext in ext_csv_list):
             image_ext = self.convert_associated_media_to_extension()
             if image_ext:
                 ext_csv_list.append(image_ext)
@@ -9,17 +9,20 @@ import csv
 import io
 import logging
 import mimetypes
+import os
 import re
 import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import zipfile
 from dataclasses import MISSING, asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 from zipfile import ZipFile
 
 import pandas as pd
-from numpy import nan
 from pandas.errors import EmptyDataError
 from pandas.io import parsers
 from dwcahandler.dwca import (BaseDwca, CoreOrExtType, CSVEncoding,
@@ -27,10 +30,43 @@ from dwcahandler.dwca import (BaseDwca, CoreOrExtType, CSVEncoding,
                               MetaDwCA, MetaElementInfo, MetaElementTypes,
                               Stat, record_diff_stat)
 
-logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    level=logging.DEBUG)
 log = logging.getLogger("Dwca")
 
+# Multimedia types for the top level media types of a format
+MEDIA_TYPES = {'image': 'StillImage', 'audio': 'Sound', 'video': 'MovingImage'}
+
+# The query and fragment of a media url, which are not part of the file name
+MEDIA_URL_QUERY = re.compile(r'[?#].*', re.DOTALL)
+# The last path segment of a media url and its extension
+MEDIA_URL_FILE_NAME = re.compile(r'([^/]*)$')
+MEDIA_URL_EXTENSION = re.compile(r'[^/]\.([^./]*)$')
+
+
+@lru_cache(maxsize=1)
+def _mime_types_by_extension() -> dict:
+    """Get the mime types keyed by lower case file extension.
+
+    The table is built once, on first use, from the mimetypes database that mimetypes.guess_type uses.
+    The database is only initialised if the application has not done so already,
+    so any types it has added are kept.
+
+    :return: A dict of extension (without the leading dot) to mime type
+    """
+    if not mimetypes.inited:
+        mimetypes.init()
+    return {ext.lstrip('.').lower(): mime_type for ext, mime_type in mimetypes.types_map.items()}
+
+
+@lru_cache(maxsize=1)
+def _guess_type_extensions() -> frozenset:
+    """Get the compressed or aliased extensions (eg svgz) that mimetypes.guess_type resolves in more than one step.
+
+    :return: The lower case extensions, without the leading dot
+    """
+    if not mimetypes.inited:
+        mimetypes.init()
+    return frozenset(ext.lstrip('.').lower() for ext in (*mimetypes.suffix_map, *mimetypes.encodings_map))
+
 
 @dataclass
 class DfContent:
@@ -38,7 +74,7 @@ class DfContent:
     meta_info: MetaElementInfo
     df_content: pd.DataFrame = field(default_factory=pd.DataFrame)
     keys: list[str] = field(init=False, default_factory=list)
-    stat: Stat = Stat(0)
+    stat: Stat = field(default_factory=Stat)
 
 
 @dataclass
@@ -47,15 +83,23 @@ class Dwca(BaseDwca):
     A concrete implementation of a Darwin Core Archive.
     """
     dwca_file_loc: Union[str, BytesIO] = field(default='./')
+    zip_compresslevel: Optional[int] = field(default=None)
     core_content: DfContent = field(init=False)
     ext_content: list[DfContent] = field(init=False, default_factory=list)
     defaults_prop: Defaults = field(init=False, default_factory=Defaults)
     meta_content: MetaDwCA = field(init=False)
     eml_content: str = field(init=False, default=None)
-    embedded_files: list[Path] = field(init=False, default_factory=list)
+    embedded_files: list[str] = field(init=False, default_factory=list)
 
     def __post_init__(self):
         self.meta_content = MetaDwCA(eml_xml_filename=self.defaults_prop.eml_xml_filename)
+        if self.zip_compresslevel is not None:
+            # Checked up front, zlib only rejects a bad level once the archive is being written
+            if (not isinstance(self.zip_compresslevel, int) or isinstance(self.zip_compresslevel, bool) or
+                    not 0 <= self.zip_compresslevel <= 9):
+                raise ValueError(f"zip_compresslevel must be an integer from 0 to 9, "
+                                 f"got {self.zip_compresslevel!r}")
+            self.defaults_prop.zip_compresslevel = self.zip_compresslevel
 
     def generate_eml(self, eml_content: Union[str, Eml] = ""):
         """
@@ -93,10 +137,21 @@ class Dwca(BaseDwca):
 
         :param core_df: The data frame to generate identifiers for
         """
-        if 'id' not in core_df.columns.to_list():
-            core_df.insert(0, 'id', core_df.apply(lambda _: uuid.uuid4(), axis=1), False)
+        if 'id' not in core_df.columns:
+            core_df.insert(0, 'id', self._generate_uuids(len(core_df)), False)
         else:
-            core_df['id'] = core_df['id'].map(lambda _: uuid.uuid4())
+            core_df['id'] = self._generate_uuids(len(core_df))
+
+    def _generate_uuids(self, count: int) -> list[uuid.UUID]:
+        """Generate random (version 4) UUIDs in bulk.
+
+        The random bytes for all the identifiers are read in one call rather than one per row.
+
+        :param count: The number of UUIDs to generate
+        :return: A list of UUIDs
+        """
+        random_bytes = os.urandom(16 * count)
+        return [uuid.UUID(bytes=random_bytes[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
 
     def _update_df(self, to_update_df, lookup_df, update_field, from_update_field):
         """Update a data frame via lookup
@@ -110,10 +165,11 @@ class Dwca(BaseDwca):
         exist = to_update_df.index.isin(lookup_df.index)
         # Note: update by querying single level index is not working??!!
         # exist = to_update_df.index.get_level_values(index_lookup_col).isin(lookup_df.index)
-        if len(to_update_df.loc[exist]) > 0:
+        update_count = int(exist.sum())
+        if update_count > 0:
             to_update_df.loc[exist, update_field] = lookup_df[from_update_field]
 
-        return len(to_update_df.loc[exist])
+        return update_count
 
     def _update_extension_ids(self, csv_content, core_df_content, link_col: list):
         """Update the extension tables with (usually generated) identifiers
@@ -131,18 +187,35 @@ class Dwca(BaseDwca):
             csv_content.pop('coreid')
 
         # Having link_col as index and column raises ambiguous error in merge
-        if (set(link_col).issubset(set(csv_content.columns.to_list())) and
-                set(link_col).issubset(set(csv_content.index.names))):
+        if (set(link_col).issubset(csv_content.columns) and
+                set(link_col).issubset(csv_content.index.names)):
             csv_content.reset_index(inplace=True, drop=True)
 
+        def link_index(df_content):
+            if len(link_col) == 1:
+                return pd.Index(df_content[link_col[0]])
+            return pd.MultiIndex.from_arrays([df_content[col] for col in link_col])
+
+        # Unique link values can be looked up directly, rather than joining the whole extension.
+        # Links of different types are left to the merge, which raises for them rather than matching nothing
+        if all(col in csv_content.columns and col in core_df_content.columns and
+               csv_content[col].dtype == core_df_content[col].dtype for col in link_col):
+            core_links = link_index(core_df_content)
+            if core_links.is_unique:
+                positions = core_links.get_indexer(link_index(csv_content))
+                linked = positions >= 0
+                # Only keep the linked rows and renumber them, as the inner merge does
+                csv_content = csv_content.loc[linked].reset_index(drop=True)
+                csv_content.insert(0, 'coreid', core_df_content['id'].to_numpy()[positions[linked]])
+                return csv_content
+
         csv_content = csv_content.merge(core_df_content.loc[:, 'id'],
                                         left_on=link_col,
                                         right_on=link_col, how='inner')
 
-        if 'id' in csv_content.columns.to_list():
-            col = csv_content.pop('id')
-            csv_content.insert(0, col.name, col)
-            csv_content.rename(columns={"id": "coreid"}, inplace=True)
+        if 'id' in csv_content.columns:
+            # Move the core id to the front as coreid, without a separate rename of the frame
+            csv_content.insert(0, 'coreid', csv_content.pop('id'))
 
         return csv_content
 
@@ -151,7 +224,7 @@ class Dwca(BaseDwca):
 
         :param assoc_files: The list of associated fields.
          """
-        self.embedded_files = [Path(file_path) for file_path in assoc_files]
+        self.embedded_files = list(assoc_files)
 
     def _read_header(self, df_content: pd.DataFrame) -> list[str]:
         """Get the column names of a data frame.
@@ -189,23 +262,22 @@ class Dwca(BaseDwca):
 
             log.info("Reading from %s", self.dwca_file_loc)
 
-            with io.TextIOWrapper(zf.open(self.defaults_prop.meta_xml_filename)) as meta_xml:
+            # The xml parser reads the raw bytes, taking the encoding from the xml declaration
+            with zf.open(self.defaults_prop.meta_xml_filename) as meta_xml:
                 self.meta_content.read_meta_file(meta_xml)
-                meta_xml.close()
 
             if self.meta_content.eml_xml_filename in files:
-                with io.TextIOWrapper(zf.open(self.meta_content.eml_xml_filename),
-                                      encoding="utf-8") as eml_xml_file:
-                    # read as string
-                    self.eml_content = eml_xml_file.read()
-                    eml_xml_file.close()
+                # read as string
+                self.eml_content = zf.read(self.meta_content.eml_xml_filename).decode("utf-8")
 
             if exclude_ext_files and len(exclude_ext_files) > 0:
                 self.meta_content.remove_meta_elements(exclude_ext_files)
 
+            self.ext_content = []
             for meta_elm in self.meta_content.meta_elements:
                 csv_file_name = meta_elm.meta_element_type.file_name
-                with io.TextIOWrapper(zf.open(csv_file_name), encoding="utf-8") as csv_file:
+                # The C parser decodes the raw member stream itself, so no text wrapper is needed
+                with zf.open(csv_file_name) as csv_file:
                     dwc_headers = [f.field_name for f in meta_elm.fields if f.index is not None]
                     csv_encoding = {key: convert_values(value) for key, value in
                                     asdict(meta_elm.meta_element_type.csv_encoding).items()}
@@ -219,9 +291,6 @@ class Dwca(BaseDwca):
                     else:
                         self.ext_content.append(self._set_content(csv_content,
                                                                   meta_elm.meta_element_type))
-                    csv_file.close()
-
-            zf.close()
 
     def _add_new_columns(self, df_content, delta_df_content):
         """Add additional columns to a data frame
@@ -231,9 +300,8 @@ class Dwca(BaseDwca):
         :param df_content: The base data frame content
         :param delta_df_content: The data frane content to add
         """
-        df_columns = df_content.columns.to_list()
-        delta_df_columns = delta_df_content.columns.to_list()
-        new_columns = list(set(delta_df_columns) - set(df_columns))
+        # Index difference keeps the delta column order, a set difference does not
+        new_columns = delta_df_content.columns.difference(df_content.columns, sort=False).to_list()
         if len(new_columns) > 0:
             # Set to empty string instead of nan to resolve warning message
             # see https://pandas.pydata.org/pdeps/0006-ban-upcasting.html
@@ -255,8 +323,7 @@ class Dwca(BaseDwca):
         # Extract columns that need updating, excluding self.keys and id
         non_update_column = ['id', 'coreid']
         non_update_column.extend(keys)
-        update_columns = [i for i in delta_df_content.columns.to_list()
-                          if i not in non_update_column]
+        update_columns = delta_df_content.columns.difference(non_update_column, sort=False)
 
         updated_rows = self._update_df(df_content, delta_df_content,
                                        update_columns, update_columns)
@@ -273,22 +340,24 @@ class Dwca(BaseDwca):
         """
         return core_content[core_content.index.isin(delta_core_content.index)].index
 
-    def _delete_old_ext_records(self, content, core_content, delta_core_content, core_keys):
+    def _delete_old_ext_records(self, content, core_exist, core_keys):
         """Drop all extension rows where core records are exist in both content and delta
 
         :param content: The extension
-        :param core_content: The core records
-        :param delta_core_content: The delta update
+        :param core_exist: The index of the core records that exist in both content and delta
         :param core_keys: The key fields
         """
-        core_exist = self._find_records_exist_in_both(core_content, delta_core_content)
-        exist = content.df_content.index
-        for key in core_keys:
-            exist = exist.get_level_values(key).isin(core_exist)
-        if len(content.df_content.loc[exist]) > 0:
+        index = content.df_content.index
+        if len(core_keys) == 1:
+            ext_core_keys = index.get_level_values(core_keys[0])
+        else:
+            ext_core_keys = pd.MultiIndex.from_arrays([index.get_level_values(key) for key in core_keys])
+        exist = ext_core_keys.isin(core_exist)
+        drop_count = exist.sum()
+        if drop_count > 0:
             log.info("Number of rows dropped from extension %s because of ext_sync: %s",
-                     content.meta_info.type.name, str(len(content.df_content.loc[exist])))
-            content.df_content.drop(content.df_content.iloc[exist].index, inplace=True)
+                     content.meta_info.type.name, str(drop_count))
+            content.df_content = content.df_content.loc[~exist]
 
     def _add_new_rows(self, df_content, new_rows):
         """
@@ -379,7 +448,7 @@ class Dwca(BaseDwca):
         all_columns = self._read_header(content.df_content)
         sanitized_fields = self.meta_content.map_headers(all_columns)
         list_fields = [f.field_name for f in sanitized_fields]
-        dup_fields = [item for item in set(list_fields) if list_fields.count(item) > 1]
+        dup_fields = [item for item, count in Counter(list_fields).items() if count > 1]
         if len(dup_fields) > 0:
             log.error("Duplicate fields found: %s", ','.join(dup_fields))
         return dup_fields
@@ -426,25 +495,29 @@ class Dwca(BaseDwca):
         :param stat: A statistics object to record updates
         :return:
         """
+        # The patterns are compiled once and shared by every pass over dynamicProperties
+        dcterms_property = re.compile(f',?"dcterms_{re.escape(col)}":".*?"')
+        dcterms_value = re.compile(f'"dcterms_{re.escape(col)}":"(.*?)"')
+
+        def remove_dcterms_property(properties):
+            return properties.str.replace(dcterms_property, '', regex=True).str.replace('{,', '{', regex=False)
+
         # Step 1: if dcterms_xxx is not null, replace the dcterms_xxx into xxx field,
         # also clean up the dynamic properties for the rows
         to_update = df[other_col].notnull()  # df[dup].isnull() &
         df.loc[to_update, col] = df.loc[to_update, other_col]
-        stat.add_update_stat(len(df[to_update]))
-        log.info(df.loc[to_update, col])
+        stat.add_update_stat(int(to_update.sum()))
+        # Only format the updated values when they will actually be logged
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(df.loc[to_update, col])
         # Also cleanup the dynamicProperties
-        df.loc[to_update, 'dynamicProperties'] = df.loc[to_update, 'dynamicProperties'].str.replace(
-            f'(,?)("dcterms_{col}":".*?")(?=,?)', '', regex=True).str.replace('{,', '{', regex=True)
+        df.loc[to_update, 'dynamicProperties'] = remove_dcterms_property(df.loc[to_update, 'dynamicProperties'])
 
         # Step 2: Check if col value is still null. If null, extract from the dynamic properties
         to_update = df[col].isnull()
-        df.loc[to_update, col] = df.loc[to_update, 'dynamicProperties'].\
-            str.extract(rf'.*?"dcterms_{col}":"(.*?)"')[0]
-        df.loc[to_update, 'dynamicProperties'] = (
-                    df.loc[to_update, 'dynamicProperties'].str.
-                    replace(f'(,?)("dcterms_{col}":".*?")(?=,?)', '', regex=True).str.
-                    replace('{,', '{', regex=True))
-        stat.add_update_stat(len(df[to_update]))
+        df.loc[to_update, col] = df.loc[to_update, 'dynamicProperties'].str.extract(dcterms_value, expand=False)
+        df.loc[to_update, 'dynamicProperties'] = remove_dcterms_property(df.loc[to_update, 'dynamicProperties'])
+        stat.add_update_stat(int(to_update.sum()))
         df.drop(columns=[other_col], inplace=True)
 
     def _regenerate_coreids(self):
@@ -453,8 +526,7 @@ class Dwca(BaseDwca):
         Adds an `id` column if one does not exist and generates a UUID (4) for each core row.
         Corresponding extension rows are updated to match.
         """
-        self.core_content.df_content['id'] = (self.core_content.df_content['id'].
-                                              map(lambda _: uuid.uuid4()))
+        self.core_content.df_content['id'] = self._generate_uuids(len(self.core_content.df_content))
         for content in self.ext_content:
             content.df_content = self._update_extension_ids(
                 content.df_content, self.core_content.df_content, self.core_content.keys)
@@ -535,12 +607,12 @@ class Dwca(BaseDwca):
          """
         delete_content = pd.DataFrame()
         if isinstance(records_to_delete.files, pd.DataFrame):
-            delete_content = records_to_delete.files.copy(deep=True)
+            # Only the index is changed, so a shallow copy is enough to leave the caller's frame untouched
+            delete_content = records_to_delete.files.copy(deep=False)
         else:
-            delete_content = self._combine_contents(records_to_delete.files, records_to_delete.csv_encoding,
-                                                    use_chunking=False)
-        valid_delete_file = (all(col in delete_content.columns for col in records_to_delete.keys)
-                             or len(delete_content) > 0)
+            delete_content = self._combine_contents(records_to_delete.files, records_to_delete.csv_encoding)
+        valid_delete_file = (not delete_content.empty and
+                             all(col in delete_content.columns for col in records_to_delete.keys))
         if not valid_delete_file:
             log.info("No records removed. Delete file does not contain any records "
                      "or it doesn't contain the columns: %s ", ','.join(records_to_delete.keys))
@@ -581,16 +653,16 @@ class Dwca(BaseDwca):
         :param keys: The additional keys
         :return: The content data frame with additional indexes for the keys
         """
-        # Core key is first level, hence need to be set first, then followed by extension key
-        if not set(core_keys).issubset(df_content.columns.to_list()):
+        # Core key is first level, hence need to be set first, then followed by extension key.
+        # All the levels are set in one go, rather than appending one key at a time
+        index_keys = core_keys + [key for key in keys if key not in core_keys]
+        if not set(core_keys).issubset(df_content.columns):
             self._add_core_key(df_content, core_df_content, core_keys)
-            df_content.set_index(core_keys, inplace=True, drop=True)
+            df_content.set_index(index_keys, inplace=True, drop=False)
+            df_content.drop(columns=core_keys, inplace=True)
         else:
-            df_content.set_index(core_keys, inplace=True, drop=False)
+            df_content.set_index(index_keys, inplace=True, drop=False)
 
-        for key in keys:
-            if key not in core_keys:
-                df_content.set_index(key, inplace=True, drop=False, append=True)
         return df_content
 
     # Extension Sync
@@ -606,13 +678,21 @@ class Dwca(BaseDwca):
         self.build_indexes()
         delta_dwca.build_indexes()
 
+        if extension_sync:
+            # The core records in both are the same for every extension, so only look them up once
+            core_exist = self._find_records_exist_in_both(self.core_content.df_content,
+                                                          delta_dwca.core_content.df_content)
+
+        # Look up contents by row type once, rather than scanning the extensions for every delta extension.
+        # The core and then the first extension of a row type take precedence, as in get_content
+        contents = {content.meta_info.type.row_type_ns: content for content in reversed(self.ext_content)}
+        contents[self.core_content.meta_info.type.row_type_ns] = self.core_content
+
         for _, delta_content in enumerate(delta_dwca.ext_content):
-            content, _ = self.get_content(delta_content.meta_info.type.row_type_ns)
+            content = contents.get(delta_content.meta_info.type.row_type_ns)
             if content:
                 if extension_sync:
-                    self._delete_old_ext_records(content, self.core_content.df_content,
-                                                 delta_dwca.core_content.df_content,
-                                                 self.core_content.keys)
+                    self._delete_old_ext_records(content, core_exist, self.core_content.keys)
                 # create a copy of list
                 # Use keys other than coreid. Coreid should not be used as update keys if possible
                 ext_keys = []
@@ -627,6 +707,7 @@ class Dwca(BaseDwca):
             else:
                 # Copy delta ext content into self ext content
                 self.ext_content.append(delta_content)
+                contents[delta_content.meta_info.type.row_type_ns] = delta_content
                 self._update_meta_fields(delta_content)
 
         self.core_content.df_content = self._merge_df_content(content=self.core_content,
@@ -660,73 +741,49 @@ class Dwca(BaseDwca):
         Attempt to populate the format and type from the url provided in the multimedia ext if none is provided
         :param multimedia_content: Multimedia content derived from the extension of this Dwca class object
         """
-        def get_media_format_prefix(media_format: str):
-            media_format_prefixes = ["image", "audio", "video"]
-            if media_format and isinstance(media_format, str) and '/' in media_format:
-                prefix = media_format.split('/')[0]
-                if prefix in media_format_prefixes:
-                    return prefix
-
-            return None
-
-        def get_media_type(media_format: str):
-            media_type = None
-            m_type = get_media_format_prefix(media_format)
-            if m_type == 'image':
-                media_type = 'StillImage'
-            elif m_type == 'audio':
-                media_type = 'Sound'
-            elif m_type == 'video':
-                media_type = 'MovingImage'
-            if media_type is None and media_format:
-                log.warning("Unknown media type for format %s", media_format)
-
-            return media_type
-
-        def get_multimedia_format_type(row: dict):
-            url = row['identifier']
-            media_format = None
-            if url:
-                try:
-                    mime_type = mimetypes.guess_type(url)
-                    if mime_type and len(mime_type) > 0 and mime_type[0]:
-                        media_format = mime_type[0]
-                except Exception as error:
-                    log.error("Error getting mimetype from url %s: %s", url, error)
-
-            media_type = ''
-            if 'type' not in row or not row['type'] or row['type'] is nan:
-                media_type = get_media_type(media_format)
-            else:
-                media_type = row['type']
-
-            row['format'] = media_format if media_format else None
-            row['type'] = media_type if media_type else None
-            return row
-
         if len(multimedia_content.df_content) > 0:
 
             multimedia_df = multimedia_content.df_content
 
-            if 'format' in multimedia_df.columns:
-                multimedia_without_format = multimedia_df[multimedia_df['format'].isnull()]
-                if len(multimedia_without_format) > 0:
-                    multimedia_without_format = multimedia_without_format.apply(
-                                                                    lambda row: get_multimedia_format_type(row),
-                                                                    axis=1)
-                    multimedia_df.update(multimedia_without_format)
-            else:
-                multimedia_df = multimedia_df.apply(lambda row: get_multimedia_format_type(row), axis=1)
-
-            multimedia_without_type = multimedia_df
-            # In case if the type was not populated from format
-            if 'type' in multimedia_df.columns:
-                multimedia_without_type = multimedia_df[multimedia_df['type'].isnull()]
-                multimedia_without_type = multimedia_without_type[multimedia_without_type['format'].notnull()]
-
-            if len(multimedia_without_type) > 0:
-                multimedia_without_type.loc[:, 'type'] = multimedia_without_type['format'].map(lambda x: get_media_type(x))
-                multimedia_df.update(multimedia_without_type)
+            # Fill the format and then the type column by column, only for the rows missing them
+            if 'format' not in multimedia_df.columns:
+                multimedia_df['format'] = None
+
+            without_format = multimedia_df['format'].isnull()
+            if without_format.any():
+                # The format is looked up from the extension of the last path segment of the url,
+                # leaving out the query and fragment
+                identifiers = multimedia_df.loc[without_format, 'identifier']
+                paths = identifiers.str.replace(MEDIA_URL_QUERY, '', regex=True)
+                extensions = paths.str.extract(MEDIA_URL_EXTENSION, expand=False).str.lower()
+                media_formats = extensions.map(_mime_types_by_extension())
+                # data urls and compressed or aliased extensions (eg svgz) are left to guess_type,
+                # which is given just the file name so the result does not depend on how it parses urls
+                is_data_url = identifiers.str.startswith('data:', na=False)
+                to_guess = is_data_url | extensions.isin(_guess_type_extensions())
+                if to_guess.any():
+                    file_names = paths.str.extract(MEDIA_URL_FILE_NAME, expand=False)
+                    media_formats[to_guess] = identifiers.where(is_data_url, file_names)[to_guess].map(
+                        lambda url: mimetypes.guess_type(url)[0])
+                multimedia_df.loc[without_format, 'format'] = media_formats.mask(media_formats.isnull(), None)
+
+            if 'type' not in multimedia_df.columns:
+                multimedia_df['type'] = None
+
+            # Columns added while merging are filled with empty strings, so those count as missing too
+            without_type = ((multimedia_df['type'].isnull() | multimedia_df['type'].eq('')) &
+                            multimedia_df['format'].notnull() & multimedia_df['format'].ne(''))
+            if without_type.any():
+                # The type is given by the top level media type of the format, eg image in image/jpeg
+                media_formats = multimedia_df.loc[without_type, 'format']
+                media_format_parts = media_formats.str.partition('/')
+                media_types = media_format_parts[0].where(media_format_parts[1] == '/').map(MEDIA_TYPES)
+                unknown_media_types = media_types.isnull()
+                if unknown_media_types.any():
+                    log.warning("Unknown media type for formats %s",
+                                ', '.join(media_formats[unknown_media_types].unique()))
+                # Keep None rather than nan for the unknown types, as for the other missing values
+                multimedia_df.loc[without_type, 'type'] = media_types.mask(unknown_media_types, None)
 
             multimedia_content.df_content = multimedia_df
 
@@ -744,10 +801,17 @@ class Dwca(BaseDwca):
         image_df = pd.DataFrame(content[assoc_media_col])
         # filter off empty rows with empty value
         image_df = image_df[~image_df[assoc_media_col].isna()]
+        if len(image_df) == 0:
+            # Nothing to split, an all empty column may not even be of string type
+            return image_df
+
+        # Split on a single literal separator rather than a regex character class
+        media = image_df[assoc_media_col].astype(str).str.replace(';', '|', regex=False)
+        image_df = image_df.assign(identifier=media.str.split('|', regex=False)).explode('identifier')
+        # Values made up of separators only leave empty identifiers behind
+        image_df = image_df[image_df['identifier'].str.len() > 0]
+        image_df = image_df.drop(columns=[assoc_media_col])
         if len(image_df) > 0:
-            image_df = image_df.assign(identifier=image_df[assoc_media_col].
-                                       str.split(r'[\\|;]')).explode('identifier')
-            image_df.drop(columns=[assoc_media_col], inplace=True)
             content.drop(columns=[assoc_media_col], inplace=True)
 
         return image_df
@@ -759,8 +823,7 @@ class Dwca(BaseDwca):
         :return: Either the new extension file or None for nothing done
         """
         core_fields = self._read_header(self.core_content.df_content)
-        filtered_column = list(filter(lambda term:
-                                      re.fullmatch('.*associatedMedia', term), core_fields))
+        filtered_column = [term for term in core_fields if term.endswith('associatedMedia')]
         if len(filtered_column) > 0:
             log.info("Extracting associated media links")
             assoc_media_col = filtered_column[0]
@@ -774,24 +837,31 @@ class Dwca(BaseDwca):
 
         return None
 
-    def _combine_contents(self, contents: list, csv_encoding, use_chunking=False):
+    def _combine_contents(self, contents: list, csv_encoding):
         """Combine the contents of a list of CSV files into a single content data frame.
 
         :param contents: The list of CSV files
         :param csv_encoding: The encoding to use
-        :param use_chunking: Chunk large files while reading
         :return: The resulting data frame
         """
         if len(contents) > 0:
             if isinstance(contents[0], pd.DataFrame):
                 return contents[0].copy(deep=True)
 
-            df_content = pd.DataFrame()
-            for content in contents:
-                df_content = self._add_new_rows(df_content,
-                                                self._read_csv(content, ignore_header_lines=0,
-                                                               csv_encoding_param=csv_encoding,
-                                                               iterator=use_chunking))
+            def read_content(content):
+                return self._read_csv(content, ignore_header_lines=0,
+                                      csv_encoding_param=csv_encoding)
+
+            if len(contents) > 1:
+                # read_csv releases the GIL while parsing, so several files can be read side by side
+                with ThreadPoolExecutor(max_workers=min(len(contents), os.cpu_count() or 1)) as executor:
+                    frames = list(executor.map(read_content, contents))
+            else:
+                frames = [read_content(content) for content in contents]
+
+            # Concatenate once, appending frame by frame copies the accumulated rows each time.
+            # The per file row numbers overlap and are not used, so a fresh index is built instead
+            df_content = pd.concat(frames, ignore_index=True)
 
             log.info("Extracted total of %d records from %s",
                      self.count_stat(df_content), ','.join(contents))
@@ -827,20 +897,25 @@ class Dwca(BaseDwca):
         def report_error(content, keys, message, condition, error_file=None):
             log.error("%s found in keys %s", message, keys)
             log.error("\n%s count\n%s", message, condition.sum())
-            log.error("\n%s", content.loc[condition.values, keys].index.tolist())
+            error_content = content.loc[condition.values, keys]
+            log.error("\n%s", error_content.index.tolist())
             if error_file:
-                content.loc[condition.values, keys].to_csv(error_file, index=False)
+                error_content.to_csv(error_file, index=False)
 
         checks_status: bool = True
         if len(keys) > 0:
-            empty_values_condition = content_keys_df.isnull()
-            if empty_values_condition.values.any():
+            # Only build the full null mask when a key column actually has nulls
+            if any(series.hasnans for _, series in content_keys_df.items()):
+                empty_values_condition = content_keys_df.isnull()
                 report_error(content_keys_df, keys, "Empty Values", empty_values_condition)
                 checks_status = False
 
             # check incase-sensitive duplicates
             def to_lower(df):
-                df = df.apply(lambda x: x.str.lower() if x.dtype == "object" else x)
+                # Replace the text columns one by one on a shallow copy, the keys frame itself is left as is
+                df = df.copy(deep=False)
+                for col in df.columns[df.dtypes == "object"]:
+                    df[col] = df[col].str.lower()
                 return df
 
             df_keys = to_lower(content_keys_df)
@@ -871,12 +946,12 @@ class Dwca(BaseDwca):
         :return: True if all columns have a valid name,
                 False if a name is blank or column contain some unnamed header
         """
-        headers = self._read_header(content.df_content)
-        if sum(not c or c.isspace() for c in headers) > 0:
+        headers = content.df_content.columns
+        if (headers.isna() | (headers.str.strip() == '')).any():
             log.error("Some column headers are blank")
             return False
 
-        if content.df_content.columns.str.contains('^unnamed:', case=False).any():
+        if headers.str.contains('^unnamed:', case=False).any():
             log.error("One or more column is unnamed. "
                       "This usually happens if there are empty column in the csv")
             return False
@@ -951,15 +1026,17 @@ class Dwca(BaseDwca):
             self.ext_content.append(content)
 
     def _to_csv(self, df: pd.DataFrame, meta_info: MetaElementInfo,
-                write_header: bool = False) -> str:
+                write_header: bool = False, csv_file: io.TextIOBase = None) -> Union[str, None]:
         """Convert a data frame into CSV
 
         :param df: The data frame
         :param meta_info: Information about the columns and expected encoding
         :param write_header: Write a header to the top of CSV
-        :return: The CSV content as a string
+        :param csv_file: The file to write the CSV to (if not supplied, the CSV content is returned)
+        :return: The CSV content as a string, or None if written to csv_file
         """
         content = df.to_csv(
+            csv_file,
             lineterminator='\r\n' if meta_info.csv_encoding.csv_eol == '\\r\\n' else meta_info.csv_encoding.csv_eol,
             sep=meta_info.csv_encoding.csv_delimiter,
             quotechar=meta_info.csv_encoding.csv_text_enclosure,
@@ -979,8 +1056,10 @@ class Dwca(BaseDwca):
             return v.lower() in ("yes", "true", "t", "1")
 
         header = str2bool(content.meta_info.ignore_header_lines)
-        dwca_zip.writestr(content.meta_info.file_name,
-                          self._to_csv(content.df_content, content.meta_info, header))
+        # Stream the csv into the zip entry rather than building the whole file as a string first
+        with io.TextIOWrapper(dwca_zip.open(content.meta_info.file_name, 'w', force_zip64=True),
+                              encoding='utf-8', newline='') as csv_file:
+            self._to_csv(content.df_content, content.meta_info, header, csv_file)
 
     def _write_associated_files(self, dwca_zip: ZipFile):
         """Write any additional files to a zip file
@@ -988,7 +1067,7 @@ class Dwca(BaseDwca):
         :param dwca_zip: The zip file to write to
         """
         for file in self.embedded_files:
-            dwca_zip.write(file, file.name)
+            dwca_zip.write(file, Path(file).name)
 
     def write_dwca(self, output_dwca_path: Union[str | BytesIO]):
         """Write a full DwCA to a zip file
@@ -997,7 +1076,8 @@ class Dwca(BaseDwca):
         :param output_dwca_path: The file path to write the .zip file to
         """
         with ZipFile(output_dwca_path, 'w', allowZip64=True,
-                     compression=zipfile.ZIP_DEFLATED) as dwca_zip:
+                     compression=zipfile.ZIP_DEFLATED,
+                     compresslevel=self.defaults_prop.zip_compresslevel) as dwca_zip:
             self._write_df_content_to_zip_file(dwca_zip=dwca_zip, content=self.core_content)
             for ext in self.ext_content:
                 self._write_df_content_to_zip_file(dwca_zip=dwca_zip, content=ext)
@@ -1009,7 +1089,7 @@ class Dwca(BaseDwca):
         log.info("Dwca written to: %s", output_dwca_path)
 
     def _read_csv(self,
-                  csv_file: str | io.TextIOWrapper,
+                  csv_file: str | io.IOBase,
                   csv_encoding_param: CSVEncoding = MISSING,
                   columns: list = None,
                   ignore_header_lines: int = 0,
@@ -1042,6 +1122,8 @@ class Dwca(BaseDwca):
         line_terminator = csv_encoding_param.csv_eol \
             if (csv_encoding_param.csv_eol not in ['\r\n', '\n', '\\r\\n']) \
             else None
+        # Memory map local files to avoid the buffered read copies, streams and urls are read as is
+        memory_map = isinstance(csv_file, (str, Path)) and Path(csv_file).is_file()
 
         try:
             ret_val = pd.read_csv(csv_file, delimiter=csv_encoding_param.csv_delimiter,
@@ -1055,7 +1137,8 @@ class Dwca(BaseDwca):
                                   index_col=False,
                                   chunksize=chunksize if iterator else None,
                                   iterator=iterator,
-                                  nrows=nrows if nrows > 0 else None)
+                                  nrows=nrows if nrows > 0 else None,
+                                  memory_map=memory_map)
 
             if isinstance(ret_val, pd.DataFrame):
                 # Drop rows where all the columns are Nan
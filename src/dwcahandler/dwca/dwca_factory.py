@@ -4,12 +4,11 @@ Module contains factory class for Dwca. This is used to decide the type of darwi
 """
 
 import logging
-from typing import Union
+from typing import Optional, Union
 import pandas as pd
 from dwcahandler.dwca import CsvFileType, Dwca, Terms, Eml
 from io import BytesIO
 
-logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
 log = logging.getLogger("DwcaFactoryManager")
 
 
@@ -26,7 +25,8 @@ class DwcaHandler:
                     output_dwca_path: Union[str, BytesIO],
                     ext_csv_list: list[CsvFileType] = None,
                     validate_content: bool = True,
-                    eml_content: Union[str, Eml] = ''):
+                    eml_content: Union[str, Eml] = '',
+                    zip_compresslevel: Optional[int] = None):
         """Create a suitable DwCA from a list of CSV files
 
         :param core_csv: The core source
@@ -34,38 +34,46 @@ class DwcaHandler:
         :param output_dwca_path: Where to place the resulting Dwca
         :param validate_content: Validate the DwCA before processing
         :param eml_content: eml content in string or Eml class
+        :param zip_compresslevel: The deflate level (0-9) of the archive, defaults to 1
         """
-        Dwca().create_dwca(core_csv=core_csv, ext_csv_list=ext_csv_list, output_dwca_path=output_dwca_path,
-                           validate_content=validate_content, eml_content=eml_content)
+        Dwca(zip_compresslevel=zip_compresslevel).create_dwca(core_csv=core_csv, ext_csv_list=ext_csv_list,
+                                                              output_dwca_path=output_dwca_path,
+                                                              validate_content=validate_content,
+                                                              eml_content=eml_content)
 
     @staticmethod
-    def remove_extension_files(dwca_file: str, ext_files: list, output_dwca_path: str):
+    def remove_extension_files(dwca_file: str, ext_files: list, output_dwca_path: str,
+                               zip_compresslevel: Optional[int] = None):
         """Load a DwCA and remove extension files from it
 
         :param dwca_file: The path to the DwCA
         :param ext_files: A list of extension files to delete
         :param output_dwca_path: Where to place the resulting DwCA
+        :param zip_compresslevel: The deflate level (0-9) of the archive, defaults to 1
         """
-        Dwca(dwca_file_loc=dwca_file).remove_extensions(exclude_ext_files=ext_files,
-                                                        output_dwca_path=output_dwca_path)
+        Dwca(dwca_file_loc=dwca_file,
+             zip_compresslevel=zip_compresslevel).remove_extensions(exclude_ext_files=ext_files,
+                                                                    output_dwca_path=output_dwca_path)
 
     @staticmethod
     def delete_records(dwca_file: Union[str, BytesIO], records_to_delete: CsvFileType,
-                       output_dwca_path: Union[str, BytesIO]):
+                       output_dwca_path: Union[str, BytesIO], zip_compresslevel: Optional[int] = None):
         """Delete core records listed in the records_to_delete file from DwCA.
         The specified keys listed in records_to_delete param must exist in the dwca core file
 
         :param dwca_file: The path to the DwCA
         :param records_to_delete: File containing the records to delete and the column key for mapping
         :param output_dwca_path: Where to place the resulting DwCA
+        :param zip_compresslevel: The deflate level (0-9) of the archive, defaults to 1
         """
-        Dwca(dwca_file_loc=dwca_file).delete_records_in_dwca(records_to_delete=records_to_delete,
-                                                             output_dwca_path=output_dwca_path)
+        Dwca(dwca_file_loc=dwca_file,
+             zip_compresslevel=zip_compresslevel).delete_records_in_dwca(records_to_delete=records_to_delete,
+                                                                         output_dwca_path=output_dwca_path)
 
     @staticmethod
     def merge_dwca(dwca_file: Union[str, BytesIO], delta_dwca_file: Union[str, BytesIO], output_dwca_path: Union[str, BytesIO],
                    keys_lookup: dict = None, extension_sync: bool = False, regen_ids: bool = False,
-                   validate_delta_content: bool = True):
+                   validate_delta_content: bool = True, zip_compresslevel: Optional[int] = None):
         """Merge a DwCA with a delta DwCA of changes.
 
         :param dwca_file: The path to the existing DwCA
@@ -75,11 +83,13 @@ class DwcaHandler:
         :param extension_sync: Synchronise extensions
         :param regen_ids: Regenerate the unique ids used to tye core and extension records together
         :param validate_delta_content: Validate the delta DwCA before using
+        :param zip_compresslevel: The deflate level (0-9) of the archive, defaults to 1
         """
         delta_dwca = Dwca(dwca_file_loc=delta_dwca_file)
-        Dwca(dwca_file_loc=dwca_file).merge_dwca(delta_dwca=delta_dwca, output_dwca_path=output_dwca_path,
-                                                 keys_lookup=keys_lookup, extension_sync=extension_sync,
-                                                 regen_ids=regen_ids, validate_delta=validate_delta_content)
+        Dwca(dwca_file_loc=dwca_file,
+             zip_compresslevel=zip_compresslevel).merge_dwca(delta_dwca=delta_dwca, output_dwca_path=output_dwca_path,
+                                                             keys_lookup=keys_lookup, extension_sync=extension_sync,
+                                                             regen_ids=regen_ids, validate_delta=validate_delta_content)
 
     @staticmethod
     def validate_dwca(dwca_file: str, keys_lookup: dict = None, error_file: str = None):
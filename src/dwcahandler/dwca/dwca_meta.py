@@ -10,7 +10,7 @@ import xml.etree.ElementTree as ET
 from xml.dom import minidom
 import re
 from urllib.parse import urlparse
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import ClassVar
 from typing import Optional
 from dwcahandler.dwca import CSVEncoding, CoreOrExtType, Terms
@@ -67,9 +67,8 @@ class MetaElementTypes:
         :param row_type: The row type URI
         :return: The corresponding element
         """
-        for elm in asdict(MetaElementTypes()).values():
-            if elm['row_type_ns'] == row_type:
-                return MetaElementTypes.get_element(elm['name'])
+        if row_type in ROW_TYPE_ELEMENTS:
+            return ROW_TYPE_ELEMENTS[row_type]
 
         # For custom namespace
         return Element(MetaElementTypes.extract_term(row_type), row_type)
@@ -90,6 +89,11 @@ class MetaElementTypes:
         return term_string
 
 
+# Lookup of the known row types by their URI, built once at import
+ROW_TYPE_ELEMENTS: dict[str, Element] = {elm.row_type_ns: elm for elm in vars(MetaElementTypes).values()
+                                         if isinstance(elm, Element)}
+
+
 @dataclass
 class MetaElementInfo:
     """A description of a core or extension file containing whether
@@ -134,6 +138,10 @@ class MetaDwCA:
 
     def __post_init__(self):
         self.terms_df = Terms().terms_df
+        # Case-insensitive lookup of term to uri, the first uri is kept for terms defined more than once
+        lower_terms = self.terms_df['term'].str.lower()
+        first_terms = ~lower_terms.duplicated(keep='first')
+        self.term_uris = dict(zip(lower_terms[first_terms], self.terms_df.loc[first_terms, 'uri']))
 
         # initialise own instance of meta content
         self.dwca_meta = ET.Element('archive')
@@ -217,8 +225,7 @@ class MetaDwCA:
     def __get_terms(self, field_elm):
         # Some terms from dwca contain strings like dcterms:
         col_name = self.__remove_prefix(field_elm)
-        return col_name if len(self.terms_df[self.terms_df['term'].str.lower() == col_name.lower()]) <= 0 \
-            else self.terms_df[self.terms_df['term'].str.lower() == col_name.lower()]['uri'].values[0]
+        return self.term_uris.get(col_name.lower(), col_name)
 
     def map_headers(self, headers: list[str], start_index: int = -1) -> list[Field]:
         """Map header column names onto a list of fields.
@@ -285,7 +292,7 @@ class MetaDwCA:
         location = ET.SubElement(files, 'location')
         location.text = meta_elem_attrib.meta_element_type.file_name
         id_field = ET.SubElement(elem, 'id') \
-            if meta_elem_attrib.meta_element_type.core_or_ext_type == 'core' \
+            if meta_elem_attrib.meta_element_type.core_or_ext_type == CoreOrExtType.CORE \
             else ET.SubElement(elem, 'coreid')
         id_field.attrib['index'] = '0'
 
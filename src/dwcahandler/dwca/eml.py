@@ -1,5 +1,6 @@
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 import metapype.eml.export
 from metapype.eml import names
 import metapype.model.metapype_io
@@ -18,28 +19,34 @@ class Eml:
     rights: str = field(default='')
 
     def build_eml_xml(self):
-        # Write EML XML
-        eml = Node(names.EML)
-        eml.add_attribute('packageId', self.package_id)
-        eml.add_attribute('system', self.system)
+        # The xml only depends on these fields, so it is built once per distinct set of values
+        return _build_eml_xml(self.package_id, self.system, self.dataset_name, self.description, self.rights)
 
-        dataset = Node(names.DATASET, parent=eml)
-        eml.add_child(dataset)
 
-        title = Node(names.TITLE, parent=dataset)
-        title.content = self.dataset_name
-        dataset.add_child(title)
+@lru_cache(maxsize=32)
+def _build_eml_xml(package_id: str, system: str, dataset_name: str, description: str, rights: str):
+    # Write EML XML
+    eml = Node(names.EML)
+    eml.add_attribute('packageId', package_id)
+    eml.add_attribute('system', system)
 
-        abstract = Node(names.ABSTRACT, parent=eml)
-        abstract.content = self.description
-        eml.add_child(abstract)
+    dataset = Node(names.DATASET, parent=eml)
+    eml.add_child(dataset)
 
-        intellectual_rights = Node(names.INTELLECTUALRIGHTS, parent=dataset)
-        eml.add_child(intellectual_rights)
+    title = Node(names.TITLE, parent=dataset)
+    title.content = dataset_name
+    dataset.add_child(title)
 
-        para = Node(names.PARA, parent=intellectual_rights, content=self.rights)
-        para.content = f"{self.rights}"
-        intellectual_rights.add_child(para)
+    abstract = Node(names.ABSTRACT, parent=eml)
+    abstract.content = description
+    eml.add_child(abstract)
 
-        xml_str = metapype.eml.export.to_xml(eml)
-        return xml_str
+    intellectual_rights = Node(names.INTELLECTUALRIGHTS, parent=dataset)
+    eml.add_child(intellectual_rights)
+
+    para = Node(names.PARA, parent=intellectual_rights, content=rights)
+    para.content = f"{rights}"
+    intellectual_rights.add_child(para)
+
+    xml_str = metapype.eml.export.to_xml(eml)
+    return xml_str
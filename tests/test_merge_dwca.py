@@ -145,3 +145,125 @@ class TestMergeDwcaContent:
                 pd.testing.assert_frame_equal(multimedia_df_output.drop(columns='coreid'), expected_multimedia_df)
 
             zf.close()
+
+    def test_merge_ext_records_with_extension_sync(self):
+        """
+        Test for extension sync, extension rows of the core records in both dwca are replaced by the delta rows
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    ["2", "species2"],
+                                    ["3", "species3"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg", "image/jpeg", "StillImage"],
+                                           ["2", "https://image2.jpg", "image/jpeg", "StillImage"],
+                                           ["3", "https://image3.jpg", "image/jpeg", "StillImage"]],
+                                     columns=["occurrenceID", "identifier", "format", "type"])
+
+        delta_occ_df = pd.DataFrame(data=[["3", "species3"],
+                                          ["4", "species4"]],
+                                    columns=['occurrenceID', 'scientificName'])
+
+        delta_multimedia_df = pd.DataFrame(data=[["3", "https://new-image3.jpg", "image/jpeg", "StillImage"],
+                                                 ["4", "https://image4.jpg", "image/jpeg", "StillImage"]],
+                                           columns=["occurrenceID", "identifier", "format", "type"])
+
+        output_obj = BytesIO()
+
+        keys_lookup: dict = dict()
+        keys_lookup['occurrence'] = ['occurrenceID']
+        keys_lookup['multimedia'] = ['identifier']
+
+        DwcaHandler.merge_dwca(dwca_file=make_dwca(occ_df, multimedia_df),
+                               delta_dwca_file=make_dwca(delta_occ_df, delta_multimedia_df),
+                               output_dwca_path=output_obj,
+                               keys_lookup=keys_lookup, extension_sync=True)
+
+        expected_multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg", "image/jpeg", "StillImage"],
+                                                    ["2", "https://image2.jpg", "image/jpeg", "StillImage"],
+                                                    ["3", "https://new-image3.jpg", "image/jpeg", "StillImage"],
+                                                    ["4", "https://image4.jpg", "image/jpeg", "StillImage"]],
+                                              columns=["occurrenceID", "identifier", "format", "type"])
+
+        with ZipFile(output_obj, 'r') as zf:
+            with zf.open('multimedia.csv') as multimedia_file:
+                multimedia_df_output = pd.read_csv(multimedia_file, dtype='str')
+                pd.testing.assert_frame_equal(multimedia_df_output.drop(columns='coreid'), expected_multimedia_df)
+
+            zf.close()
+
+    def test_merge_ext_records_with_extension_sync_multiple_keys(self):
+        """
+        Test for extension sync where the core records are identified by multiple keys
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    ["2", "species2"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg"],
+                                           ["2", "https://image2.jpg"]],
+                                     columns=["occurrenceID", "identifier"])
+
+        delta_occ_df = pd.DataFrame(data=[["2", "species2"]],
+                                    columns=['occurrenceID', 'scientificName'])
+
+        delta_multimedia_df = pd.DataFrame(data=[["2", "https://new-image2.jpg"]],
+                                           columns=["occurrenceID", "identifier"])
+
+        output_obj = BytesIO()
+
+        keys_lookup: dict = dict()
+        keys_lookup['occurrence'] = ['occurrenceID', 'scientificName']
+        keys_lookup['multimedia'] = ['identifier']
+
+        DwcaHandler.merge_dwca(dwca_file=make_dwca(occ_df, multimedia_df),
+                               delta_dwca_file=make_dwca(delta_occ_df, delta_multimedia_df),
+                               output_dwca_path=output_obj,
+                               keys_lookup=keys_lookup, extension_sync=True)
+
+        with ZipFile(output_obj, 'r') as zf:
+            with zf.open('multimedia.csv') as multimedia_file:
+                multimedia_df_output = pd.read_csv(multimedia_file, dtype='str')
+                assert multimedia_df_output['identifier'].to_list() == ["https://image1.jpg",
+                                                                        "https://new-image2.jpg"]
+
+            zf.close()
+
+    def test_merge_ext_records_fills_type_added_by_delta(self):
+        """
+        Test that a type column brought in by the delta is filled for the existing records
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    ["2", "species2"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg", "image/jpeg"]],
+                                     columns=["occurrenceID", "identifier", "format"])
+
+        delta_occ_df = pd.DataFrame(data=[["2", "species2"]],
+                                    columns=['occurrenceID', 'scientificName'])
+
+        delta_multimedia_df = pd.DataFrame(data=[["2", "https://image2.jpg", "image/jpeg", "StillImage"]],
+                                           columns=["occurrenceID", "identifier", "format", "type"])
+
+        output_obj = BytesIO()
+
+        keys_lookup: dict = dict()
+        keys_lookup['occurrence'] = ['occurrenceID']
+        keys_lookup['multimedia'] = ['identifier']
+
+        DwcaHandler.merge_dwca(dwca_file=make_dwca(occ_df, multimedia_df),
+                               delta_dwca_file=make_dwca(delta_occ_df, delta_multimedia_df),
+                               output_dwca_path=output_obj,
+                               keys_lookup=keys_lookup, extension_sync=True)
+
+        expected_multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg", "image/jpeg", "StillImage"],
+                                                    ["2", "https://image2.jpg", "image/jpeg", "StillImage"]],
+                                              columns=["occurrenceID", "identifier", "format", "type"])
+
+        with ZipFile(output_obj, 'r') as zf:
+            with zf.open('multimedia.csv') as multimedia_file:
+                multimedia_df_output = pd.read_csv(multimedia_file, dtype='str')
+                pd.testing.assert_frame_equal(multimedia_df_output.drop(columns='coreid'), expected_multimedia_df)
+
+            zf.close()
@@ -1,4 +1,5 @@
 import pandas as pd
+from numpy import nan
 import dwcahandler
 from dwcahandler.dwca import CsvFileType, CoreOrExtType
 from dwcahandler.dwca.core_dwca import Dwca
@@ -26,18 +27,12 @@ image_ext = CsvFileType(files=pd.DataFrame(data=[["1", IMAGE_URL],
                         keys=['occurrenceID'])
 
 
-def mock_guess_type(url):
-    if url == MIMETYPE_IMAGE_URL:
-        return ('image/webp', None)
-    elif url == INVALID_MIMETYPE_URL:
-        return ('image/jpeg', None)
-    return (None, None)
-
-
 @pytest.fixture
 def mock_mime_types(monkeypatch, request):
     if request.config.getoption("--github-action-run"):
-        monkeypatch.setattr(dwcahandler.dwca.core_dwca.mimetypes, "guess_type", mock_guess_type)
+        # Do not rely on the mime types registered on the host for the extensions used in the tests
+        monkeypatch.setattr(dwcahandler.dwca.core_dwca, "_mime_types_by_extension",
+                            lambda: {'webp': 'image/webp', 'jpeg': 'image/jpeg'})
 
 
 class TestMultimediaExtension:
@@ -79,6 +74,64 @@ class TestMultimediaExtension:
         assert sorted(list(map(attrgetter('field_name'), dwca.meta_content.meta_elements[1].fields))) == \
                sorted(['coreid', 'identifier'])
 
+    def test_extract_associate_media_separators(self):
+        """
+        Test for associated media separated by semicolons or vertical bars, ignoring empty entries
+        """
+        occ_associated_media_df = pd.DataFrame(data=[["1", "species1", f"{IMAGE_URL};{AUDIO_URL}"],
+                                                     ["2", "species2", f"{VIDEO_URL}|"],
+                                                     ["3", "species3", None]],
+                                               columns=['occurrenceID', 'scientificName', 'associatedMedia'])
+
+        dwca = Dwca()
+
+        dwca.extract_csv_content(csv_info=CsvFileType(files=occ_associated_media_df,
+                                                      keys=['occurrenceID'],
+                                                      type='occurrence'),
+                                 core_ext_type=CoreOrExtType.CORE)
+
+        associated_media_image_ext = dwca.convert_associated_media_to_extension()
+
+        expected_image_df = pd.DataFrame(data=[["1", IMAGE_URL],
+                                               ["1", AUDIO_URL],
+                                               ["2", VIDEO_URL]],
+                                         columns=['occurrenceID', 'identifier'])
+
+        pd.testing.assert_frame_equal(associated_media_image_ext.files.reset_index(), expected_image_df)
+
+        # Separators without any media are not extracted and the core is left as is
+        occ_associated_media_df = pd.DataFrame(data=[["1", "species1", "|"],
+                                                     ["2", "species2", ";"],
+                                                     ["3", "species3", None]],
+                                               columns=['occurrenceID', 'scientificName', 'associatedMedia'])
+
+        dwca = Dwca()
+
+        dwca.extract_csv_content(csv_info=CsvFileType(files=occ_associated_media_df,
+                                                      keys=['occurrenceID'],
+                                                      type='occurrence'),
+                                 core_ext_type=CoreOrExtType.CORE)
+
+        assert dwca.convert_associated_media_to_extension() is None
+        assert 'associatedMedia' in dwca.core_content.df_content.columns
+        assert sorted(list(map(attrgetter('field_name'), dwca.meta_content.meta_elements[0].fields))) == \
+               sorted(dwca.core_content.df_content.columns)
+
+        # An associated media column without any values is numeric (all nan) and is left as is
+        occ_associated_media_df = pd.DataFrame(data=[["1", "species1", nan],
+                                                     ["2", "species2", nan]],
+                                               columns=['occurrenceID', 'scientificName', 'associatedMedia'])
+
+        dwca = Dwca()
+
+        dwca.extract_csv_content(csv_info=CsvFileType(files=occ_associated_media_df,
+                                                      keys=['occurrenceID'],
+                                                      type='occurrence'),
+                                 core_ext_type=CoreOrExtType.CORE)
+
+        assert dwca.convert_associated_media_to_extension() is None
+        assert 'associatedMedia' in dwca.core_content.df_content.columns
+
     def test_fill_additional_multimedia_info(self, mock_mime_types):
         """
         Test for fill additional multimedia info if format and type is not provided
@@ -231,3 +284,41 @@ class TestMultimediaExtension:
         # if format and type is provided it remains as provided
         pd.testing.assert_frame_equal(dwca.ext_content[0].df_content.drop(
             columns=['coreid']), expected_multimedia_df)
+
+    def test_fill_multimedia_info_format_from_url_path(self):
+        """
+        Test that the format is filled from the file name of the url, leaving out the query and fragment,
+        and that data urls and compressed extensions are filled as mimetypes.guess_type does
+        """
+        dwca = Dwca()
+
+        dwca.extract_csv_content(csv_info=CsvFileType(files=pd.DataFrame(data=[["1", "species1"],
+                                                                               ["2", "species2"]],
+                                                                         columns=['occurrenceID', 'scientificName']),
+                                                      type='occurrence',
+                                                      keys=['occurrenceID']),
+                                 core_ext_type=CoreOrExtType.CORE)
+
+        multimedia_data = [["1", "data:image/png;base64,iVBOR"],
+                           ["1", "https://images.org/image.svgz?size=large"],
+                           ["2", "https://images.org/image.jpg?width=200"],
+                           ["2", "https://images.org/image.png#thumbnail"],
+                           ["2", "https://images.org/view?file=image.jpg"]]
+
+        dwca.extract_csv_content(csv_info=CsvFileType(files=pd.DataFrame(data=multimedia_data,
+                                                                         columns=['occurrenceID', 'identifier']),
+                                                      type='multimedia',
+                                                      keys=['occurrenceID']),
+                                 core_ext_type=CoreOrExtType.EXTENSION)
+
+        dwca.fill_additional_info()
+
+        expected_multimedia_df = pd.DataFrame(data=[multimedia_data[0] + ["image/png", "StillImage"],
+                                                    multimedia_data[1] + ["image/svg+xml", "StillImage"],
+                                                    multimedia_data[2] + ["image/jpeg", "StillImage"],
+                                                    multimedia_data[3] + ["image/png", "StillImage"],
+                                                    multimedia_data[4] + [None, None]],
+                                              columns=['occurrenceID', 'identifier', 'format', 'type'])
+
+        pd.testing.assert_frame_equal(dwca.ext_content[0].df_content.drop(
+            columns=['coreid']), expected_multimedia_df)
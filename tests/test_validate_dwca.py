@@ -0,0 +1,67 @@
+import pandas as pd
+from dwcahandler import DwcaHandler, CsvFileType
+from tests import make_dwca
+
+
+class TestValidateContent:
+
+    def test_validate_unique_keys(self):
+        """
+        Test that content with unique, non-empty keys passes validation
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    ["2", "species2"],
+                                    ["3", "species3"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        assert DwcaHandler.validate_file(CsvFileType(files=occ_df, type='occurrence', keys=['occurrenceID']))
+
+    def test_validate_duplicate_keys(self):
+        """
+        Test that duplicate keys, regardless of case, fail validation
+        """
+        occ_df = pd.DataFrame(data=[["a1", "species1"],
+                                    ["b2", "species2"],
+                                    ["A1", "species3"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        assert not DwcaHandler.validate_file(CsvFileType(files=occ_df, type='occurrence', keys=['occurrenceID']))
+
+    def test_validate_duplicate_multiple_keys(self):
+        """
+        Test that a combination of keys is checked for duplicates as a whole
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1", "-30.0000"],
+                                    ["1", "species2", "-28.0000"],
+                                    ["2", "species1", "-36.0000"]],
+                              columns=['catalogNumber', 'scientificName', 'decimalLatitude'])
+
+        assert DwcaHandler.validate_file(CsvFileType(files=occ_df, type='occurrence',
+                                                     keys=['catalogNumber', 'scientificName']))
+
+        occ_df.loc[1, 'scientificName'] = "SPECIES1"
+        assert not DwcaHandler.validate_file(CsvFileType(files=occ_df, type='occurrence',
+                                                         keys=['catalogNumber', 'scientificName']))
+
+    def test_validate_empty_keys(self):
+        """
+        Test that empty key values fail validation
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    [None, "species2"],
+                                    ["3", "species3"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        assert not DwcaHandler.validate_file(CsvFileType(files=occ_df, type='occurrence', keys=['occurrenceID']))
+
+    def test_validate_dwca(self):
+        """
+        Test validation of the core content of a dwca
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"],
+                                    ["2", "species2"],
+                                    ["2", "species3"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        assert DwcaHandler.validate_dwca(dwca_file=make_dwca(occ_df), keys_lookup={'occurrence': 'scientificName'})
+        assert not DwcaHandler.validate_dwca(dwca_file=make_dwca(occ_df), keys_lookup={'occurrence': 'occurrenceID'})
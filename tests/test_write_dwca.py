@@ -1,4 +1,5 @@
 import io
+import pytest
 from dwcahandler import DwcaHandler, CsvFileType, CoreOrExtType
 from zipfile import ZipFile
 from pathlib import Path
@@ -167,3 +168,94 @@ class TestWriteDwca:
                 pd.testing.assert_frame_equal(df.drop(columns=['id']), occ_df)
 
             zf.close()
+
+    def test_generate_dwca_with_ext_multiple_keys(self):
+        """
+        Test that extension records are linked to the core by a combination of keys
+        """
+        occ_df = pd.DataFrame(data=[["1", "AM", "species1"],
+                                    ["1", "CSIRO", "species2"],
+                                    ["2", "AM", "species3"]],
+                              columns=['catalogNumber', 'institutionCode', 'scientificName'])
+
+        multimedia_df = pd.DataFrame(data=[["2", "AM", "https://image3.jpg", "image/jpeg", "StillImage"],
+                                           ["1", "CSIRO", "https://image2.jpg", "image/jpeg", "StillImage"],
+                                           ["3", "AM", "https://image4.jpg", "image/jpeg", "StillImage"],
+                                           ["1", "AM", "https://image1.jpg", "image/jpeg", "StillImage"]],
+                                     columns=['catalogNumber', 'institutionCode', 'identifier', 'format', 'type'])
+
+        keys = ['catalogNumber', 'institutionCode']
+        core_csv = CsvFileType(files=occ_df, type='occurrence', keys=keys)
+        ext_csv = CsvFileType(files=multimedia_df, type='multimedia', keys=keys)
+
+        dwca_output = io.BytesIO()
+
+        DwcaHandler.create_dwca(core_csv=core_csv, ext_csv_list=[ext_csv], output_dwca_path=dwca_output,
+                                eml_content=get_eml_content())
+
+        with ZipFile(dwca_output, 'r') as zf:
+            with zf.open('occurrence.csv') as occ_file:
+                occ_output_df = pd.read_csv(occ_file, dtype='str')
+            with zf.open('multimedia.csv') as multimedia_file:
+                multimedia_output_df = pd.read_csv(multimedia_file, dtype='str')
+
+            zf.close()
+
+        # The record without a core record is not linked
+        pd.testing.assert_frame_equal(multimedia_output_df.drop(columns=['coreid']),
+                                      multimedia_df.drop(index=2).reset_index(drop=True))
+
+        linked_df = multimedia_output_df.merge(occ_output_df, left_on='coreid', right_on='id')
+        assert len(linked_df) == len(multimedia_output_df)
+        assert (linked_df['catalogNumber_x'] == linked_df['catalogNumber_y']).all()
+        assert (linked_df['institutionCode_x'] == linked_df['institutionCode_y']).all()
+
+    def test_generate_dwca_with_ext_mismatched_key_types(self):
+        """
+        Test that extension keys of a different type to the core keys are not silently left unlinked
+        """
+        occ_df = pd.DataFrame(data=[[1, "species1"],
+                                    [2, "species2"]],
+                              columns=['occurrenceID', 'scientificName'])
+
+        multimedia_df = pd.DataFrame(data=[["1", "https://image1.jpg"],
+                                           ["2", "https://image2.jpg"]],
+                                     columns=['occurrenceID', 'identifier'])
+
+        core_csv = CsvFileType(files=occ_df, type='occurrence', keys=['occurrenceID'])
+        ext_csv = CsvFileType(files=multimedia_df, type='multimedia', keys=['occurrenceID'])
+
+        with pytest.raises(ValueError):
+            DwcaHandler.create_dwca(core_csv=core_csv, ext_csv_list=[ext_csv], output_dwca_path=io.BytesIO(),
+                                    eml_content=get_eml_content())
+
+    def test_generate_dwca_with_compresslevel(self):
+        """
+        Test that the compression level is passed through to the archive
+        """
+        occ_df = pd.DataFrame(data=[[str(i), "species1"] for i in range(100)],
+                              columns=['occurrenceID', 'scientificName'])
+
+        compress_sizes = {}
+        for compresslevel in (0, 9):
+            dwca_output = io.BytesIO()
+            DwcaHandler.create_dwca(core_csv=CsvFileType(files=occ_df, type='occurrence', keys=['occurrenceID']),
+                                    output_dwca_path=dwca_output, eml_content=get_eml_content(),
+                                    zip_compresslevel=compresslevel)
+            with ZipFile(dwca_output, 'r') as zf:
+                compress_sizes[compresslevel] = zf.getinfo('occurrence.csv').compress_size
+
+        assert compress_sizes[9] < compress_sizes[0]
+
+    def test_generate_dwca_with_invalid_compresslevel(self):
+        """
+        Test that an out of range compression level is rejected before anything is written
+        """
+        occ_df = pd.DataFrame(data=[["1", "species1"]], columns=['occurrenceID', 'scientificName'])
+
+        for compresslevel in (-1, 10, "9"):
+            with pytest.raises(ValueError, match="zip_compresslevel"):
+                DwcaHandler.create_dwca(core_csv=CsvFileType(files=occ_df, type='occurrence',
+                                                             keys=['occurrenceID']),
+                                        output_dwca_path=io.BytesIO(), eml_content=get_eml_content(),
+                                        zip_compresslevel=compresslevel)